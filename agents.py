@@ -12,14 +12,25 @@ from tools import LinkedInTool, FirecrawlSearchTool, AppendInterestsTool
 INTERESTS_FILE = Path(__file__).resolve().parent / "my_interests.md"
 
 
-def create_agents():
-    """Create and return all five agents for the crew."""
+def create_tools():
+    """Create the tool instances used by the agents. They hold no per-run state, so callers may reuse them."""
+    return {
+        "linkedin": LinkedInTool(),
+        "firecrawl": FirecrawlSearchTool(),
+        "file_read": FileReadTool(file_path=str(INTERESTS_FILE)),
+        "append_interests": AppendInterestsTool(),
+    }
+
+
+def create_agents(tools=None):
+    """Create and return all five agents for the crew, using `tools` from create_tools() if given."""
 
     # --- Tools ---
-    linkedin_tool = LinkedInTool()
-    firecrawl_tool = FirecrawlSearchTool()
-    file_read_tool = FileReadTool(file_path=str(INTERESTS_FILE))
-    append_interests_tool = AppendInterestsTool()
+    tools = tools or create_tools()
+    linkedin_tool = tools["linkedin"]
+    firecrawl_tool = tools["firecrawl"]
+    file_read_tool = tools["file_read"]
+    append_interests_tool = tools["append_interests"]
 
     # 1. Orchestrator (Manager) – oversees delegation and task assignment.
     # No tools: CrewAI injects delegation tools when used as manager.
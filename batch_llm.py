@@ -0,0 +1,84 @@
+"""
+LLM adapter that routes completions through the OpenAI Batch API (/v1/batches).
+
+Batch requests are billed at roughly half the synchronous price but can take minutes
+to complete, so this is only used for non-realtime runs (CREW_BATCH_MODE=1 in main.py).
+
+Each call is its own single-request batch: CrewAI's ReAct loop needs every completion
+before it can issue the next, so there is nothing to buffer. The discount is per token,
+not per batch; the cost is latency. A call gives up (and cancels its batch) after
+`max_wait` seconds.
+
+Needs CrewAI < 1.0 (see requirements.txt): from 1.0, LLM(...) hands OpenAI models to a
+native client class, so a subclass's __init__ and call() would never run.
+"""
+from __future__ import annotations
+
+import json
+import time
+
+from crewai import LLM
+from openai import OpenAI
+from openai.types import CompletionUsage
+
+_TERMINAL_FAILURES = {"failed", "expired", "cancelled"}
+
+
+class BatchLLM(LLM):
+    """crewai LLM whose plain-text completions are submitted as one-request OpenAI batches."""
+
+    def __init__(self, model: str, poll_interval: float = 15.0, max_wait: float = 60 * 60, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self._client = OpenAI()
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        # Native function calling needs the synchronous tool loop; fall back to the normal path.
+        if tools:
+            return super().call(
+                messages, tools=tools, callbacks=callbacks, available_functions=available_functions, **kwargs
+            )
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+
+        body = {"model": self.model.removeprefix("openai/"), "messages": messages}
+        # Provider-specific fields (e.g. prompt_cache_key) passed to LLM(extra_body=...) go in the request body.
+        body.update(getattr(self, "additional_params", {}).get("extra_body") or {})
+        if self.temperature is not None:
+            body["temperature"] = self.temperature
+        if self.max_tokens:
+            body["max_tokens"] = self.max_tokens
+        if self.stop:
+            body["stop"] = self.stop[:4]  # OpenAI accepts at most four stop sequences
+        line = {"custom_id": "crew-0", "method": "POST", "url": "/v1/chat/completions", "body": body}
+
+        batch_input = self._client.files.create(
+            file=("batch.jsonl", (json.dumps(line) + "\n").encode("utf-8")), purpose="batch"
+        )
+        batch = self._client.batches.create(
+            input_file_id=batch_input.id, endpoint="/v1/chat/completions", completion_window="24h"
+        )
+        deadline = time.monotonic() + self.max_wait
+        while batch.status != "completed":
+            if batch.status in _TERMINAL_FAILURES:
+                raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status!r}")
+            if time.monotonic() >= deadline:
+                self._client.batches.cancel(batch.id)
+                raise TimeoutError(f"OpenAI batch {batch.id} not completed after {self.max_wait:.0f}s; cancelled")
+            time.sleep(self.poll_interval)
+            batch = self._client.batches.retrieve(batch.id)
+
+        if not batch.output_file_id:
+            errors = self._client.files.content(batch.error_file_id).text if batch.error_file_id else ""
+            raise RuntimeError(f"OpenAI batch {batch.id} returned no output: {errors}")
+        result = json.loads(self._client.files.content(batch.output_file_id).text.splitlines()[0])["response"]["body"]
+
+        # Report usage the way LLM.call does, so the crew's token accounting includes batched calls.
+        usage = result.get("usage")
+        if usage:
+            usage = CompletionUsage.model_validate(usage)
+            for callback in callbacks or []:
+                if hasattr(callback, "log_success_event"):
+                    callback.log_success_event(kwargs=body, response_obj={"usage": usage}, start_time=0, end_time=0)
+        return result["choices"][0]["message"]["content"]
@@ -5,7 +5,13 @@ personal context, critique, and a question architect.
 """
 from __future__ import annotations
 
+import argparse
+import logging
 import os
+import re
+import threading
+from datetime import datetime
+from functools import lru_cache
 
 try:
     from dotenv import load_dotenv
@@ -14,22 +20,106 @@ except ImportError:
     pass  # .env not loaded if python-dotenv not installed
 
 from crewai import Crew, Process, LLM
-from agents import create_agents
-from tasks import create_tasks
+from agents import create_agents, create_tools
+from batch_llm import BatchLLM
+from report_stream import ReportStream
+from tasks import bind_tasks
+from tools.file_io import atomic_write
+from tools.firecrawl_search_tool import warm_search_cache
+
+logger = logging.getLogger(__name__)
 
 # Ensure required keys are present (at least for the LLM)
 if not os.getenv("OPENAI_API_KEY"):
     print("Warning: OPENAI_API_KEY not set. Set it in .env for the crew to run.")
 
+# Runs of non-alphanumerics collapse to "_" in report filenames.
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+@lru_cache(maxsize=1)
+def shared_llms() -> dict:
+    """
+    LLM clients shared across runs, so their HTTP pools and tokenizers are initialized once.
+    Built on first use rather than at import: constructing a client can require OPENAI_API_KEY,
+    and `import main` / `main.py --help` should work without it.
+    """
+    # Each client gets its own OpenAI prompt_cache_key: CrewAI puts the stable role/backstory/tool prompt
+    # first, so grouping calls that share that prefix lets OpenAI serve it from its prompt cache.
+    # CREW_BATCH_MODE=1: route worker calls through the OpenAI Batch API (~50% cheaper, much slower).
+    worker_cls = BatchLLM if os.getenv("CREW_BATCH_MODE") == "1" else LLM
+    llms = {
+        # Manager runs on every delegation round: keep it cheap and stream so output pipelines as it arrives.
+        "manager": LLM(model="gpt-4o-mini", stream=True, extra_body={"prompt_cache_key": "crew_mgr_v1"}),
+        "cheap": worker_cls(model="gpt-4o-mini", extra_body={"prompt_cache_key": "crew_worker_mini_v1"}),
+        # Better accuracy for research and report writing
+        "stronger": worker_cls(model="gpt-4o", extra_body={"prompt_cache_key": "crew_worker_4o_v1"}),
+        # Question Architect's prompt prefix differs from the researcher's, so it gets its own cache key.
+        "report": worker_cls(model="gpt-4o", extra_body={"prompt_cache_key": "crew_report_v1"}),
+    }
+    if worker_cls is BatchLLM and not isinstance(llms["cheap"], BatchLLM):
+        # A CrewAI whose LLM(...) factory swaps in another class would silently run everything synchronously.
+        raise RuntimeError(f"CREW_BATCH_MODE=1 but workers were built as {type(llms['cheap']).__name__}, not BatchLLM")
+    return llms
+
+
+def _warm() -> None:
+    """Pay cold-start costs (LLM client + tokenizer, TLS handshake, embedding model load) off the critical path."""
+    # A throwaway 1-token client rather than the shared ones: a warm-up call still in flight at kickoff would
+    # otherwise run on the same instance as the crew's first calls (and its stream would reach ReportStream).
+    # It still loads the LLM library and tokenizer and opens the connection to the API.
+    try:
+        LLM(model="gpt-4o-mini", max_tokens=1).call([{"role": "user", "content": "Reply with the single word: ok"}])
+    except Exception:
+        logger.debug("LLM warm-up call failed", exc_info=True)
+    try:
+        warm_search_cache()
+    except Exception:
+        logger.debug("Search cache warm-up failed", exc_info=True)
+
+
+# CREW_WARM=1: warm clients in the background while the crew is being assembled (off by default, e.g. for CI).
+if os.getenv("CREW_WARM") == "1":
+    threading.Thread(target=_warm, name="crew-warm", daemon=True).start()
+
+
+@lru_cache(maxsize=1)
+def shared_tools() -> dict:
+    """Tool instances (HTTP sessions, caches) are built once per process and reused by every run."""
+    return create_tools()
+
 
-def run_crew(linkedin_url: str, name: str | None = None, current_work: str | None = None):
+def build_agents() -> dict:
+    """
+    Build fresh agents on the shared tools and LLMs.
+    Agents are not reused across runs: a hierarchical kickoff adds delegation tools to the manager agent,
+    and CrewAI refuses a manager that already has tools.
+    """
+    llms = shared_llms()
+    agents = create_agents(shared_tools())
+    # Manager agent is not in crew.agents, so it does not get crew's default LLM; set it explicitly.
+    agents["orchestrator"].llm = llms["manager"]
+    agents["web_researcher"].llm = llms["stronger"]
+    agents["question_architect"].llm = llms["report"]
+    for key in ("personal_context_agent", "evidence_filter_agent", "review_critique_agent"):
+        agents[key].llm = llms["cheap"]
+    return agents
+
+
+def run_crew(
+    linkedin_url: str,
+    name: str | None = None,
+    current_work: str | None = None,
+    report_stream: ReportStream | None = None,
+):
     """
     Run the hierarchical crew with the given LinkedIn profile URL and optional disambiguation inputs.
     name and current_work help disambiguate when many people share the same name.
+    If report_stream is given, the manager's final answers are streamed to a temp file while they are generated;
+    call report_stream.finish(str(output)) afterwards to keep or drop it.
     Returns the crew's output (final task result).
     """
-    agents = create_agents()
-    task_list = create_tasks(agents, linkedin_url, name=name, current_work=current_work)
+    agents = build_agents()
+    task_list = bind_tasks(agents, linkedin_url, name=name, current_work=current_work)
 
     # Orchestrator is the manager; it must not be in the agents list (CrewAI requirement).
     worker_agents = [
@@ -40,32 +130,24 @@ def run_crew(linkedin_url: str, name: str | None = None, current_work: str | Non
         agents["question_architect"],
     ]
 
-    cheap_llm = LLM(model="gpt-4o-mini")
-    stronger_llm = LLM(model="gpt-4o")  # Better accuracy for research and report writing
-    # Manager agent is not in crew.agents, so it does not get crew's default LLM; set it explicitly.
-    agents["orchestrator"].llm = cheap_llm
-    agents["web_researcher"].llm = stronger_llm
-    agents["question_architect"].llm = stronger_llm
     crew = Crew(
         agents=worker_agents,
         tasks=task_list,
         process=Process.hierarchical,
-        llm=cheap_llm,
+        llm=shared_llms()["cheap"],
         manager_agent=agents["orchestrator"],
         memory=False,
         verbose=True,
     )
 
+    if report_stream is not None:
+        with report_stream.listen():
+            return crew.kickoff()
     result = crew.kickoff()
     return result
 
 
 if __name__ == "__main__":
-    import argparse
-    import re
-    import sys
-    from datetime import datetime
-
     parser = argparse.ArgumentParser(
         description="Run the Conversation Starter crew: research a LinkedIn profile and produce questions and conversation starters."
     )
@@ -96,20 +178,25 @@ if __name__ == "__main__":
     if current_work:
         print("  Current work (disambiguation): {}".format(current_work))
     print()
-    output = run_crew(url, name=name, current_work=current_work)
-    print("\n--- Crew output ---\n")
-    result_str = str(output) if output is not None else ""
-    print(result_str)
-
     # Save report in reports/ folder: {person_slug}_{timestamp}.md (prefer name-based slug when provided)
     slug_source = (name or url.strip("/").split("/")[-1] or "report").lower()
-    person_slug = re.sub(r"[^a-zA-Z0-9]+", "_", slug_source)
+    person_slug = _SLUG_RE.sub("_", slug_source)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     report_dir = "reports"
     os.makedirs(report_dir, exist_ok=True)
     report_filename = "{}_{}.md".format(person_slug, timestamp)
     report_path = os.path.join(report_dir, report_filename)
-    if result_str.strip():
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(result_str)
-        print("\nReport saved to {}".format(report_path))
+
+    # The crew's output is the manager's last final answer: stream it to stdout (and a temp file) as it is written.
+    report = ReportStream(report_path, shared_llms()["manager"])
+    output = run_crew(url, name=name, current_work=current_work, report_stream=report)
+    result_str = str(output) if output is not None else ""
+    # Fall back to printing the output if it was not streamed (or a later non-streamed call changed it).
+    if report.finish(result_str):
+        print("\n\nReport saved to {}".format(report_path))
+    else:
+        print("\n--- Crew output ---\n")
+        print(result_str)
+        if result_str.strip():
+            atomic_write(report_path, result_str.encode("utf-8"))
+            print("\nReport saved to {}".format(report_path))
@@ -0,0 +1,153 @@
+"""
+Stream the final report to disk (and stdout) while the manager LLM generates it.
+
+Listens to CrewAI's LLM stream events for one LLM instance. Each call's text is held back
+until its "Final Answer:" marker, so tool-use turns (Thought/Action) are never written;
+everything after the marker goes straight to `<path>.tmp` via os.write. A later call to the
+same LLM starts the file over, so after kickoff it holds the manager's last final answer,
+which is the crew's output. finish() moves it into place only if its running SHA-256 matches
+that output; if kickoff raises, the temp file is removed.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+try:
+    from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+except ImportError:  # CrewAI < 0.177 keeps the event bus under crewai.utilities
+    from crewai.utilities.events import crewai_event_bus, LLMStreamChunkEvent
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+# finish() hashes the crew's output in slices of this many characters rather than encoding it whole.
+_HASH_SLICE_CHARS = 1 << 16
+
+
+class ReportStream:
+    """Streams the final answer of `llm` towards `path`; `streamed` tells whether anything was written."""
+
+    def __init__(self, path: str, llm):
+        self.path = path
+        self.llm = llm
+        self._tmp_path = path + ".tmp"
+        self.streamed = False
+        self._fd: int | None = None
+        self._pending = ""  # text of the current call before the marker
+        self._in_answer = False
+        self._at_start = True  # strip whitespace between the marker and the report
+        self._ws_tail = ""  # trailing whitespace written but not yet hashed (the comparison strips it)
+        self._digest = hashlib.sha256()
+        self._length = 0  # bytes hashed so far
+        self._calls = 0  # calls made to `llm`; bumped before the call's first chunk is emitted
+        self._calls_seen = 0  # value of _calls when the current stream started
+        self._lock = threading.Lock()  # the event bus may dispatch handlers from worker threads
+
+    @contextmanager
+    def listen(self):
+        """Register the stream handlers for the duration of a kickoff; a failed kickoff discards the partial report."""
+        # Count calls by wrapping llm.call rather than listening for LLMCallStartedEvent: the call runs on the
+        # thread that then emits its chunks, while call-started handlers may run later on a worker thread.
+        call = self.llm.call
+
+        def counted_call(*args, **kwargs):
+            with self._lock:
+                self._calls += 1
+            return call(*args, **kwargs)
+
+        self.llm.call = counted_call
+        try:
+            with crewai_event_bus.scoped_handlers():
+                crewai_event_bus.on(LLMStreamChunkEvent)(self._on_chunk)
+                try:
+                    yield self
+                except BaseException:
+                    self.discard()
+                    raise
+        finally:
+            del self.llm.call
+
+    def finish(self, final_output: str) -> bool:
+        """
+        Close the stream and keep the streamed report only if it is the crew's final output.
+        Returns True if `path` now holds it; otherwise the temp file is removed and the caller writes the output.
+        """
+        if self._fd is None:
+            return False
+        os.close(self._fd)
+        self._fd = None
+        if self.streamed and self._matches(final_output.strip()):
+            os.replace(self._tmp_path, self.path)
+            return True
+        os.remove(self._tmp_path)
+        return False
+
+    def _matches(self, text: str) -> bool:
+        digest, length = hashlib.sha256(), 0
+        for i in range(0, len(text), _HASH_SLICE_CHARS):
+            data = text[i:i + _HASH_SLICE_CHARS].encode("utf-8", errors="replace")
+            digest.update(data)
+            length += len(data)
+        return length == self._length and digest.digest() == self._digest.digest()
+
+    def discard(self) -> None:
+        if self._fd is None:
+            return
+        os.close(self._fd)
+        self._fd = None
+        self.streamed = False
+        os.remove(self._tmp_path)
+
+    def _reset(self) -> None:
+        # A later call (next task, retry or re-delegation) supersedes whatever an earlier call wrote.
+        self._pending, self._in_answer, self._at_start, self._ws_tail = "", False, True, ""
+        self._digest, self._length = hashlib.sha256(), 0
+        if self._fd is not None:
+            os.ftruncate(self._fd, 0)
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            self.streamed = False
+
+    def _on_chunk(self, source, event) -> None:
+        if source is not self.llm:
+            return
+        with self._lock:
+            if self._calls != self._calls_seen:
+                self._calls_seen = self._calls
+                self._reset()
+            self._feed(event.chunk)
+
+    def _feed(self, chunk: str) -> None:
+        if not self._in_answer:
+            self._pending += chunk
+            idx = self._pending.find(FINAL_ANSWER_MARKER)
+            if idx == -1:
+                return
+            self._in_answer = True
+            chunk = self._pending[idx + len(FINAL_ANSWER_MARKER):]
+            self._pending = ""
+        if self._at_start:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+            self._at_start = False
+        self._write(chunk.encode("utf-8", errors="replace"))
+        # Hash all but the trailing whitespace, which only counts once more text follows it.
+        text = self._ws_tail + chunk
+        body = text.rstrip()
+        self._ws_tail = text[len(body):]
+        if body:
+            data = body.encode("utf-8", errors="replace")
+            self._digest.update(data)
+            self._length += len(data)
+
+    def _write(self, data: bytes) -> None:
+        if self._fd is None:
+            self._fd = os.open(self._tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        sys.stdout.flush()  # keep ordering with anything already printed
+        for fd in (self._fd, sys.stdout.fileno()):
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        self.streamed = True
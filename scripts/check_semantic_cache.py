@@ -0,0 +1,106 @@
+"""
+Check that PCA compression never changes a SemanticCache lookup.
+
+Feeds the real SemanticCache synthetic anisotropic embeddings (a power-law spectrum plus
+a shared component, like sentence embeddings) whose topics drift after the basis is first
+fitted, and compares every lookup with a brute-force cosine scan over the full vectors of
+the same entries. Also prints what a frozen basis with re-normalized projections (the
+previous scheme) would have scored, for contrast. Exits 1 on any mismatch.
+
+    python scripts/check_semantic_cache.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.semantic_cache import SemanticCache  # noqa: E402
+
+DIM = 384
+THRESHOLD = 0.9
+
+
+class SyntheticCache(SemanticCache):
+    """SemanticCache whose queries are keys into a table of precomputed embeddings."""
+
+    def __init__(self, vectors: dict, **kwargs):
+        super().__init__(**kwargs)
+        self.enabled = True  # sentence-transformers is not needed here
+        self.vectors = vectors
+
+    def _embed(self, query: str):
+        return self.vectors[query]
+
+
+def _unit(x):
+    return (x / np.linalg.norm(x, axis=-1, keepdims=True)).astype(np.float32)
+
+
+def main() -> int:
+    rng = np.random.default_rng(0)
+    spectrum = np.arange(1, DIM + 1) ** -0.5
+    shared = _unit(rng.standard_normal(DIM))
+
+    def topic():
+        # Each topic stretches its own random rotation of the spectrum, so later topics leave the first basis.
+        basis = np.linalg.qr(rng.standard_normal((DIM, DIM)))[0]
+        return lambda n: _unit(_unit((rng.standard_normal((n, DIM)) * spectrum) @ basis.T) + 0.35 * shared)
+
+    vectors = {}
+    stored = []
+    for t in range(6):
+        draw = topic()
+        for i, v in enumerate(draw(60)):
+            vectors[f"t{t}/{i}"] = v
+            stored.append(f"t{t}/{i}")
+    # Lookups: perturbed copies of stored queries, spread around the threshold (cosine about 0.78 to 0.98).
+    lookups = []
+    for n, key in enumerate(rng.choice(stored, 600)):
+        noise = _unit(rng.standard_normal(DIM))
+        vectors[f"q{n}"] = _unit(vectors[key] + rng.uniform(0.2, 0.8) * noise)
+        lookups.append(f"q{n}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SyntheticCache(
+            vectors, path=Path(tmp) / "cache.pkl", threshold=THRESHOLD, max_entries=512, save_every=10**9
+        )
+        frozen = None  # the first basis, kept to show what the old scheme would score
+        mismatches = frozen_crossings = compared = hits = 0
+        frozen_error = 0.0
+        candidate_share = []
+        lookup_iter = iter(lookups)
+        for k, key in enumerate(stored):
+            cache.put(key, key)
+            if frozen is None and cache._pca_matrix is not None:
+                frozen = cache._pca_matrix.copy()
+            if k < cache.pca_fit_after:
+                continue
+            query = next(lookup_iter)
+            q = vectors[query]
+            keys = [entry[0] for entry in cache._entries]
+            full = np.stack([vectors[s] for s in keys]) @ q
+            best = int(np.argmax(full))
+            expected = keys[best] if full[best] >= THRESHOLD else None
+            candidate_share.append(len(cache._candidates(q)) / len(keys))
+            got = cache.get(query)
+            compared += 1
+            hits += expected is not None
+            if got != expected:
+                mismatches += 1
+                print(f"MISMATCH {query}: cache {got!r}, exact {expected!r} ({full[best]:.3f})")
+            fq, fs = _unit(q @ frozen), _unit(np.stack([vectors[s] for s in keys]) @ frozen)
+            approx = fs @ fq
+            frozen_error = max(frozen_error, float(np.abs(approx - full).max()))
+            frozen_crossings += int(((approx >= THRESHOLD) != (full >= THRESHOLD)).sum())
+
+    print(f"lookups compared: {compared} ({hits} exact hits), mismatches: {mismatches}")
+    print(f"mean share of entries re-scored on full vectors: {np.mean(candidate_share):.1%}")
+    print(f"frozen re-normalized basis: max |error| {frozen_error:.3f}, threshold crossings {frozen_crossings}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,14 @@ CrewAI tasks for the networking research crew (hierarchical process).
 from crewai import Task, Agent
 
 
-def create_tasks(
+def bind_tasks(
     agents: dict,
     linkedin_url: str,
     name: str | None = None,
     current_work: str | None = None,
 ):
     """
-    Create the five tasks. Pass linkedin_url for Research and Evidence Filter.
+    Create the five tasks for one run, bound to the (reusable) agents. Pass linkedin_url for Research and Evidence Filter.
     name and current_work are used to disambiguate when many people share the same name.
     """
     web_researcher = agents["web_researcher"]
@@ -0,0 +1,47 @@
+"""
+Process-wide sentence-transformers model, shared by the semantic cache and any retrieval tools
+so the model is loaded (and held in memory) once.
+"""
+import importlib.util
+import os
+import threading
+from functools import lru_cache
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+_LOAD_LOCK = threading.Lock()
+# lru_cache does not memoize exceptions: remember a failed load so later callers fail fast instead of retrying it.
+_LOAD_ERROR: Exception | None = None
+
+
+def embedder_available() -> bool:
+    # find_spec only locates the package; importing it (and torch) is deferred to the first embedding.
+    return importlib.util.find_spec("sentence_transformers") is not None
+
+
+def get_embedder():
+    """Return the shared CPU embedding model, loading it on first use. A failed load is not retried."""
+    global _LOAD_ERROR
+    # lru_cache alone would let two threads racing on the first call both load the model.
+    with _LOAD_LOCK:
+        if _LOAD_ERROR is not None:
+            raise RuntimeError(f"Embedding model {EMBEDDING_MODEL_NAME} failed to load earlier: {_LOAD_ERROR}") from _LOAD_ERROR
+        try:
+            return _load_embedder()
+        except Exception as e:
+            _LOAD_ERROR = e
+            raise
+
+
+@lru_cache(maxsize=1)
+def _load_embedder():
+    # Short queries gain nothing from many torch threads, and CrewAI may embed from several tool calls at
+    # once; EMBEDDER_THREADS (default 1, 0 = torch default) caps intra-op threads to avoid oversubscription.
+    from sentence_transformers import SentenceTransformer
+
+    threads = int(os.getenv("EMBEDDER_THREADS", "1"))
+    if threads > 0:
+        import torch
+
+        torch.set_num_threads(threads)
+    return SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu")
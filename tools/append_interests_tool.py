@@ -1,6 +1,7 @@
 """
 Tool to append a new Interest entry to my_interests.md (source of truth for user context).
 """
+import re
 from pathlib import Path
 from typing import Type
 
@@ -8,8 +9,14 @@ from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
+from .file_io import atomic_write
+
 DEFAULT_INTERESTS_PATH = Path(__file__).resolve().parent.parent / "my_interests.md"
 
+# Group 1 is the first "## Interests" heading plus its lines, up to the next "## " heading or end of file.
+# Tolerates trailing whitespace after the heading and CRLF line endings (files edited on Windows).
+_INTERESTS_RE = re.compile(rb"^(## Interests[ \t]*\r?\n(?:.*\n)*?)(?=## |\r?\n## |\Z)", re.MULTILINE)
+
 
 class AppendInterestsToolInput(BaseModel):
     """Input schema for AppendInterestsTool."""
@@ -38,29 +45,25 @@ class AppendInterestsTool(BaseTool):
         content = interest_line.strip()
         if not content:
             return "No content to append."
-        new_line = f"- {content}\n"
+        bullet = f"- {content}".encode("utf-8")
         try:
-            existing = path.read_text(encoding="utf-8")
-            # Ensure there is an "## Interests" section
-            if "## Interests" not in existing:
-                existing += "\n## Interests\n"
-            # Insert after the first "## Interests" block (after first newline)
-            marker = "## Interests"
-            idx = existing.find(marker)
-            if idx == -1:
-                existing += "\n## Interests\n" + new_line
+            # One scan per append: the Interests block is usually followed by other sections, so the new
+            # bullet is spliced in with an atomic rewrite; only a block that ends the file gets a plain append.
+            existing = path.read_bytes() if path.exists() else b""
+            eol = b"\r\n" if b"\r\n" in existing else b"\n"  # keep the file's line endings
+            new_line = bullet + eol
+            if existing and not existing.endswith(b"\n"):
+                # Terminate a hand-edited last line so the block (and the new bullet) stay line-based.
+                existing += eol
+            match = _INTERESTS_RE.search(existing)
+            if match is None:
+                atomic_write(path, existing + eol + b"## Interests" + eol + new_line)
+            elif match.end(1) == len(existing) and path.stat().st_size == len(existing):
+                with open(path, "ab") as f:
+                    f.write(new_line)
             else:
-                # Find end of line after "## Interests"
-                line_end = existing.find("\n", idx) + 1
-                insert_pos = line_end
-                # Optionally find last bullet under Interests (before next ##)
-                next_section = existing.find("\n## ", line_end)
-                if next_section == -1:
-                    insert_pos = len(existing)
-                else:
-                    insert_pos = next_section
-                existing = existing[:insert_pos] + new_line + existing[insert_pos:]
-            path.write_text(existing, encoding="utf-8")
+                offset = match.end(1)
+                atomic_write(path, existing[:offset] + new_line + existing[offset:])
             return f"Appended interest: {content}"
         except Exception as e:
             return f"Failed to append to my_interests.md: {e}"
@@ -0,0 +1,57 @@
+"""
+Response cache backends for search tools.
+
+A CacheBackend maps a query string to a stored response. ExactMatchCache is the
+in-memory L1 layer; SemanticCache (tools/semantic_cache.py) follows the same
+protocol, and redis/sqlite backends can be added later without touching the tools.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+
+class CacheBackend(Protocol):
+    """Minimal interface shared by all response caches."""
+
+    def get(self, query: str) -> str | None:
+        ...
+
+    def put(self, query: str, response: str) -> None:
+        ...
+
+
+class ExactMatchCache:
+    """In-memory LRU cache keyed by the SHA-256 of the normalized query, with a TTL."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 24 * 60 * 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()  # key -> (response, timestamp)
+
+    @staticmethod
+    def key(query: str) -> str:
+        return hashlib.sha256(query.strip().lower().encode()).hexdigest()
+
+    def get(self, query: str) -> str | None:
+        key = self.key(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[1] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, query: str, response: str, timestamp: float | None = None) -> None:
+        """Store `response`; pass the time it was fetched (`timestamp`) when promoting it from another cache."""
+        key = self.key(query)
+        with self._lock:
+            self._entries[key] = (response, time.time() if timestamp is None else timestamp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,28 @@
+"""
+File writes for reports, my_interests.md and the search cache.
+Full rewrites go through atomic_write (temp file + os.replace) so a crash never leaves a partial file.
+"""
+import os
+from pathlib import Path
+
+
+def atomic_write(path: Path, data: bytes, fsync: bool = False) -> None:
+    """
+    Replace `path` with `data` atomically: write a sibling temp file, then os.replace it over `path`.
+    Pass fsync=True to flush the temp file to disk before the swap (survives power loss, costs a sync).
+    """
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.remove(tmp)
+        raise
+    os.close(fd)
+    os.replace(tmp, path)
@@ -1,19 +1,79 @@
 """
 Dynamic web search tool using Firecrawl API so agents can pass a query at runtime.
 """
+import asyncio
+import json
 import os
 import logging
 from typing import Type
 
+import httpx
 import requests
 from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from crewai.tools import BaseTool
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads  # stdlib fallback if orjson is not installed
+
+from .cache_backend import ExactMatchCache
+from .semantic_cache import SemanticCache
+
 # Set up logging for Firecrawl debugging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared across tool instances so every agent benefits from earlier searches in this and previous runs.
+# L1: byte-identical queries (manager retries); L2: near-duplicate queries by embedding similarity.
+_EXACT_CACHE = ExactMatchCache()
+_SEMANTIC_CACHE = SemanticCache()
+
+_SEARCH_URL = "https://api.firecrawl.dev/v1/search"
+
+# Read once at import (main.py loads .env before importing tools); None means searches return a config error.
+_API_KEY = os.getenv("FIRECRAWL_API_KEY")
+_HEADERS = {"Authorization": f"Bearer {_API_KEY}", "Content-Type": "application/json"} if _API_KEY else None
+
+# Keep-alive pool for the synchronous path: later searches skip the TCP + TLS handshake.
+# POST is retried explicitly (urllib3 only retries idempotent methods by default); a search has no side effects.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+if _HEADERS:
+    _SESSION.headers.update(_HEADERS)
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    """HTTP/2 client for the async path; callers scope it with `async with` so its pool is always closed."""
+    return httpx.AsyncClient(
+        http2=True,
+        headers=_HEADERS,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        timeout=30,
+    )
+
+
+def warm_search_cache() -> None:
+    """Load the semantic cache's embedding model ahead of the first search."""
+    _SEMANTIC_CACHE.warm()
+
 
 class FirecrawlSearchInput(BaseModel):
     """Input schema for dynamic Firecrawl search."""
@@ -32,67 +92,119 @@ class FirecrawlSearchTool(BaseTool):
     args_schema: Type[BaseModel] = FirecrawlSearchInput
 
     def _run(self, query: str) -> str:
-        api_key = os.getenv("FIRECRAWL_API_KEY")
-        if not api_key:
+        early = self._prepare(query)
+        if early is not None:
+            return early
+        try:
+            response = _SESSION.post(_SEARCH_URL, json=self._payload(query), timeout=30)
+            return self._handle_response(query, response)
+        except Exception as e:
+            return self._error(e)
+
+    async def _arun(self, query: str, client: httpx.AsyncClient | None = None) -> str:
+        # Cache lookups embed the query and cache stores may pickle to disk: keep both off the event loop.
+        early = await asyncio.to_thread(self._prepare, query)
+        if early is not None:
+            return early
+        try:
+            if client is None:
+                async with _new_async_client() as client:
+                    response = await client.post(_SEARCH_URL, json=self._payload(query))
+            else:
+                response = await client.post(_SEARCH_URL, json=self._payload(query))
+            return await asyncio.to_thread(self._handle_response, query, response)
+        except Exception as e:
+            return self._error(e)
+
+    async def search_many(self, queries: list[str]) -> list[str]:
+        """Run several searches concurrently over one connection pool; results keep the order of `queries`."""
+        async with _new_async_client() as client:
+            return await asyncio.gather(*[self._arun(q, client) for q in queries])
+
+    def _prepare(self, query: str) -> str | None:
+        """Shared pre-request step: a config error or cached result to return as-is, or None to search."""
+        if _HEADERS is None:
             return "Error: FIRECRAWL_API_KEY is not set in the environment."
+        cached = self._cached(query)
+        if cached is not None:
+            return cached
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Firecrawl search query: {query!r}")
+        return None
 
-        url = "https://api.firecrawl.dev/v1/search"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-        payload = {"query": query, "limit": 8}
+    @staticmethod
+    def _payload(query: str) -> dict:
+        # No scrapeOptions: without them Firecrawl returns only title/url/description, not full-page markdown.
+        return {"query": query, "limit": 8}
 
-        # Log the query being sent
-        print("\n" + "="*80)
-        print(f"🔍 FIRECRAWL SEARCH QUERY: {query}")
-        print("="*80)
+    def _handle_response(self, query: str, response) -> str:
+        """Parse a requests or httpx response (same raise_for_status/content/status_code surface) and format it."""
+        response.raise_for_status()
+        data = _loads(response.content)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Firecrawl API response status: {response.status_code}")
+        return self._format_response(query, data)
 
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Log raw response for debugging
-            logger.info(f"Firecrawl API response status: {response.status_code}")
-            logger.info(f"Firecrawl response keys: {data.keys() if isinstance(data, dict) else 'Not a dict'}")
-            
-            if not data.get("success") or "data" not in data:
-                print(f"⚠️  FIRECRAWL ERROR RESPONSE: {data}")
-                return str(data)
-            
-            results = data.get("data", [])
-            if not results:
-                print("⚠️  FIRECRAWL: No search results found.")
-                return "No search results found."
-            
-            # Log number of results
-            print(f"✅ FIRECRAWL FOUND {len(results)} RESULTS:")
-            print("-"*80)
-            
-            parts = []
-            for i, r in enumerate(results, 1):
-                title = r.get("title", "No title")
-                url_link = r.get("url", "")
-                desc = r.get("description", "") or r.get("markdown", "")[:300]
-                
-                # Print each result for visibility
-                print(f"\n[{i}] {title}")
-                print(f"    🔗 {url_link}")
-                print(f"    📄 {desc[:200]}...")
-                
-                parts.append(f"{i}. {title}\n   URL: {url_link}\n   {desc}")
-            
-            print("="*80 + "\n")
-            
-            return "\n\n".join(parts)
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Firecrawl API error: {e}"
-            print(f"❌ {error_msg}")
+    @staticmethod
+    def _error(e: Exception) -> str:
+        if isinstance(e, (requests.exceptions.RequestException, httpx.HTTPError)):
             logger.error(f"Firecrawl request error: {e}", exc_info=True)
-            return error_msg
+            return f"Firecrawl API error: {e}"
+        logger.error(f"Firecrawl unexpected error: {e}", exc_info=True)
+        return f"Error during search: {e}"
+
+    @staticmethod
+    def _cached(query: str) -> str | None:
+        """Check the exact-match cache, then the semantic cache (promoting semantic hits into L1)."""
+        # A broken cache (embedder load failure, corrupt state) must never fail the search: treat it as a miss.
+        try:
+            cached = _EXACT_CACHE.get(query)
+            if cached is None:
+                hit = _SEMANTIC_CACHE.lookup(query)
+                if hit is not None:
+                    # Keep the original fetch time so the promoted copy expires with the semantic entry.
+                    cached, fetched_at = hit
+                    _EXACT_CACHE.put(query, cached, timestamp=fetched_at)
+        except Exception as e:
+            logger.warning(f"Firecrawl: cache lookup failed, searching anyway: {e}")
+            return None
+        if cached is not None:
+            logger.info(f"Firecrawl: cache hit for {query!r}")
+        return cached
+
+    @staticmethod
+    def _store(query: str, formatted: str) -> None:
+        """Cache a formatted result set; a failure only costs the cache entry, never the fetched results."""
+        try:
+            _EXACT_CACHE.put(query, formatted)
+            _SEMANTIC_CACHE.put(query, formatted)
         except Exception as e:
-            error_msg = f"Error during search: {e}"
-            print(f"❌ {error_msg}")
-            logger.error(f"Firecrawl unexpected error: {e}", exc_info=True)
-            return error_msg
+            logger.warning(f"Firecrawl: could not cache results for {query!r}: {e}")
+
+    @staticmethod
+    def _format_response(query: str, data) -> str:
+        """Turn a Firecrawl search response into numbered results for agents, caching successful result sets."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Firecrawl response keys: {data.keys() if isinstance(data, dict) else 'Not a dict'}")
+
+        if not data.get("success") or "data" not in data:
+            logger.warning(f"Firecrawl error response: {data}")
+            return str(data)
+
+        results = data.get("data", [])
+        logger.info(f"Firecrawl: {len(results)} results for {query!r}")
+        if not results:
+            return "No search results found."
+
+        # The markdown slice is only taken when a result has no description.
+        parts = [
+            f"{i}. {r.get('title', 'No title')}\n   URL: {r.get('url', '')}\n   {r.get('description') or r.get('markdown', '')[:300]}"
+            for i, r in enumerate(results, 1)
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            for part in parts:
+                logger.debug(part)
+
+        formatted = "\n\n".join(parts)
+        FirecrawlSearchTool._store(query, formatted)
+        return formatted
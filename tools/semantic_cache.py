@@ -0,0 +1,235 @@
+"""
+Semantic response cache for search tools: near-duplicate queries reuse a prior result.
+
+Queries are embedded with a local sentence-transformers model and matched by cosine
+similarity against previously cached queries. Entries expire after a TTL and the
+least recently used entry is evicted once the cache is full. Once enough queries have
+been collected, lookups first scan PCA-compressed embeddings, and only entries whose
+similarity could still reach the threshold are re-scored on the full embeddings, so the
+compression never changes the result. The basis is refitted as new queries arrive.
+The cache is persisted every `save_every` new entries and once more at interpreter exit.
+"""
+import atexit
+import logging
+import pickle
+import threading
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # semantic cache disabled if numpy is not installed
+
+from ._embedder import EMBEDDING_MODEL_NAME, embedder_available, get_embedder
+from .file_io import atomic_write
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "firecrawl_cache.pkl"
+# Bumped when the persisted layout changes; older cache files are ignored.
+_STATE_VERSION = 2
+# Covers float32 rounding in the PCA upper bound, so it never falls just below a true score.
+_BOUND_SLACK = 1e-3
+
+
+class SemanticCache:
+    """Cosine-similarity cache mapping queries to stored responses."""
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        threshold: float = 0.9,
+        max_entries: int = 512,
+        ttl_seconds: float = 24 * 60 * 60,
+        pca_components: int = 64,
+        pca_fit_after: int = 100,
+        save_every: int = 16,
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.pca_components = pca_components
+        self.pca_fit_after = pca_fit_after
+        self.save_every = save_every
+        self.enabled = np is not None and embedder_available()
+        self._lock = threading.Lock()
+        # Parallel storage, least recently used first: row i of each array belongs to entries[i].
+        self._embeddings = None  # full-size unit embeddings, used to score candidates exactly
+        self._entries: list[tuple[str, str, float]] = []  # (query, response, timestamp)
+        # Last embedded query, so put() after a get() miss does not embed the same query twice.
+        self._last: tuple[str, object] | None = None
+        # PCA projection ((dim, pca_components) matrix), fitted once pca_fit_after entries exist and refitted
+        # after every further pca_fit_after puts, so queries on newer topics stay well inside the basis.
+        self._pca_matrix = None
+        self._reduced = None  # embeddings @ pca_matrix (not re-normalized)
+        self._residuals = None  # norm of the part of each embedding outside the basis
+        self._puts_since_fit = 0
+        self._unsaved = 0  # puts since the last save
+        if self.enabled:
+            self._load()
+            atexit.register(self.flush)
+
+    def get(self, query: str) -> str | None:
+        """Return the cached response for a query similar to `query`, or None on miss."""
+        hit = self.lookup(query)
+        return None if hit is None else hit[0]
+
+    def lookup(self, query: str) -> tuple[str, float] | None:
+        """Like get(), but also return when the response was stored, so other layers can honour the same TTL."""
+        if not self.enabled:
+            return None
+        embedding = self._embed(query)
+        with self._lock:
+            self._expire()
+            if not self._entries:
+                return None
+            candidates = self._candidates(embedding)
+            if not len(candidates):
+                return None
+            scores = self._embeddings[candidates] @ embedding
+            i = int(np.argmax(scores))
+            if scores[i] < self.threshold:
+                return None
+            # Move the hit to the most recently used end.
+            best = int(candidates[i])
+            order = [j for j in range(len(self._entries)) if j != best] + [best]
+            self._take(order)
+            entry = self._entries[-1]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Semantic cache hit ({scores[i]:.3f}) for {query!r} -> {entry[0]!r}")
+            return entry[1], entry[2]
+
+    def put(self, query: str, response: str) -> None:
+        """Store `response` for `query`, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+        embedding = self._embed(query)
+        with self._lock:
+            self._expire()
+            if len(self._entries) >= self.max_entries:
+                self._take(range(1, len(self._entries)))
+            self._entries.append((query, response, time.time()))
+            if self._embeddings is None or not len(self._embeddings):
+                self._embeddings = embedding[None, :]
+            else:
+                self._embeddings = np.vstack([self._embeddings, embedding])
+            self._puts_since_fit += 1
+            if self._pca_matrix is None:
+                if len(self._entries) >= self.pca_fit_after:
+                    self._fit_pca()
+            elif self._puts_since_fit >= self.pca_fit_after:
+                self._fit_pca()
+            else:
+                reduced, residual = self._reduce(embedding[None, :])
+                self._reduced = np.vstack([self._reduced, reduced])
+                self._residuals = np.concatenate([self._residuals, residual])
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self._save()
+
+    def flush(self) -> None:
+        """Persist entries added since the last save."""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def warm(self) -> None:
+        """Load the embedding model now so the first lookup does not pay for it."""
+        if self.enabled:
+            self._model()
+
+    def _model(self):
+        try:
+            return get_embedder()
+        except Exception as e:
+            # A model that cannot load (offline host, hub outage, rate limit) fails the same way on every query,
+            # and each attempt can take minutes: turn the cache off for the rest of the process instead.
+            self.enabled = False
+            logger.warning(f"Semantic cache disabled: embedding model {EMBEDDING_MODEL_NAME} failed to load: {e}")
+            raise
+
+    def _embed(self, query: str):
+        last = self._last
+        if last is not None and last[0] == query:
+            return last[1]
+        embedding = self._model().encode(query, normalize_embeddings=True).astype(np.float32)
+        self._last = (query, embedding)
+        return embedding
+
+    def _candidates(self, embedding):
+        """Indices of entries whose cosine with `embedding` may reach the threshold (all of them before fitting)."""
+        if self._pca_matrix is None:
+            return np.arange(len(self._entries))
+        # For unit vectors q and s split into basis and residual parts, q.s = q_b.s_b + q_r.s_r, and
+        # |q_r.s_r| <= |q_r| |s_r|: this bound never misses a true hit, however far q lies outside the basis.
+        reduced, residual = self._reduce(embedding[None, :])
+        bound = self._reduced @ reduced[0] + residual[0] * self._residuals
+        return np.flatnonzero(bound >= self.threshold - _BOUND_SLACK)
+
+    def _reduce(self, embeddings):
+        """Project unit embeddings onto the PCA basis; also return the norm of what the basis leaves out."""
+        reduced = embeddings @ self._pca_matrix
+        residual = np.sqrt(np.maximum(0.0, 1.0 - np.einsum("ij,ij->i", reduced, reduced)))
+        return reduced, residual.astype(np.float32)
+
+    def _fit_pca(self) -> None:
+        """Fit the PCA basis on the stored full-size embeddings via SVD and reduce them all."""
+        self._puts_since_fit = 0
+        full = self._embeddings
+        if self.pca_components >= min(full.shape):
+            # Too few entries left (after expiry) to compress: scan the full embeddings instead.
+            self._pca_matrix = self._reduced = self._residuals = None
+            return
+        # Not mean-centered: the bound in _candidates needs a plain orthogonal split of each unit vector.
+        _, _, vt = np.linalg.svd(full, full_matrices=False)
+        self._pca_matrix = np.ascontiguousarray(vt[: self.pca_components].T, dtype=np.float32)
+        self._reduced, self._residuals = self._reduce(full)
+
+    def _take(self, rows) -> None:
+        """Keep only `rows` (in that order) of the entries and their parallel arrays."""
+        rows = list(rows)
+        self._entries = [self._entries[i] for i in rows]
+        self._embeddings = self._embeddings[rows]
+        if self._pca_matrix is not None:
+            self._reduced = self._reduced[rows]
+            self._residuals = self._residuals[rows]
+
+    def _expire(self) -> None:
+        """Drop entries older than the TTL (entries are ordered by use, so scan all)."""
+        cutoff = time.time() - self.ttl_seconds
+        keep = [i for i, (_, _, ts) in enumerate(self._entries) if ts >= cutoff]
+        if len(keep) != len(self._entries):
+            self._take(keep)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+            # Older files hold only projected embeddings, which cannot be scored exactly.
+            if state.get("model_name") == EMBEDDING_MODEL_NAME and state.get("version") == _STATE_VERSION:
+                self._entries = state["entries"]
+                self._embeddings = state["embeddings"]
+                self._pca_matrix = state["pca_matrix"]
+                if self._pca_matrix is not None:
+                    self._reduced, self._residuals = self._reduce(self._embeddings)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable semantic cache {self.path}: {e}")
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            state = {
+                "version": _STATE_VERSION,
+                "model_name": EMBEDDING_MODEL_NAME,
+                "entries": self._entries,
+                "embeddings": self._embeddings,
+                "pca_matrix": self._pca_matrix,
+            }
+            atomic_write(self.path, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+            self._unsaved = 0
+        except Exception as e:
+            logger.warning(f"Could not persist semantic cache to {self.path}: {e}")